@@ -4,6 +4,8 @@ Build script for creating executable files for NumPad Typing Test.
 Supports the new project structure with sources/ and builds/ directories.
 """
 
+import argparse
+import hashlib
 import os
 import sys
 import shutil
@@ -11,6 +13,9 @@ import subprocess
 import platform
 from pathlib import Path
 
+# The platform never changes while running, so look it up once
+_SYSTEM = platform.system()
+
 
 def get_project_root():
     """Get the project root directory."""
@@ -27,34 +32,58 @@ def get_assets_dir():
     return get_project_root() / "assets"
 
 
+def get_source_names():
+    """Get the names of the files in the sources directory in one pass."""
+    with os.scandir(get_sources_dir()) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+def get_spec_path():
+    """Get the path of the PyInstaller spec file written by the first build."""
+    return get_project_root() / "NumPad.spec"
+
+
+def get_spec_key_path():
+    """Get the file recording the options the current spec was written from."""
+    return get_project_root() / "build" / ".spec_key"
+
+
 def get_build_command():
-    """Get the PyInstaller command with updated paths."""
-    system = platform.system()
+    """
+    Get the PyInstaller command with updated paths.
+
+    Returns:
+        tuple: (command, options_key) where options_key hashes the full
+        option list the spec is generated from
+    """
+    system = _SYSTEM
     sources_dir = get_sources_dir()
     assets_dir = get_assets_dir()
     project_root = get_project_root()
 
+    output_options = [
+        "--noconfirm",
+        "--distpath",
+        str(project_root / "dist"),
+        "--workpath",
+        str(project_root / "build"),
+    ]
+
     base_cmd = [
         "pyinstaller",
         "--onefile",
         "--windowed",
         "--name",
         "NumPad",
-        "--distpath",
-        str(project_root / "dist"),
-        "--workpath",
-        str(project_root / "build"),
+        *output_options,
         "--specpath",
         str(project_root),
+        # The sibling modules are found by import analysis and bundled as
+        # compiled code, so they need no --add-data copies
+        "--paths",
+        str(sources_dir),
     ]
 
-    # Add all source files as additional data
-    source_files = ["core.py", "characters.py", "style.py", "widgets.py"]
-    for source_file in source_files:
-        source_path = sources_dir / source_file
-        if source_path.exists():
-            base_cmd.extend(["--add-data", f"{source_path}:."])
-
     # Add platform-specific options
     if system == "Windows":
         icon_path = assets_dir / "icon.ico"
@@ -74,15 +103,32 @@ def get_build_command():
     main_script = sources_dir / "numpad.py"
     base_cmd.append(str(main_script))
 
-    return base_cmd
+    # Reuse the spec from a previous build only while it was written from
+    # these same options; together with the kept build/ directory this lets
+    # PyInstaller reuse its analysis cache. Otherwise the full command
+    # regenerates the spec.
+    options_key = hashlib.sha256(
+        "\0".join(base_cmd).encode("utf-8")
+    ).hexdigest()
+    spec_path = get_spec_path()
+    key_path = get_spec_key_path()
+    if (
+        spec_path.exists()
+        and key_path.exists()
+        and key_path.read_text(encoding="utf-8").strip() == options_key
+    ):
+        return ["pyinstaller", *output_options, str(spec_path)], options_key
+
+    return base_cmd, options_key
 
 
 def clean_build_artifacts():
     """Clean up build artifacts from previous builds."""
     project_root = get_project_root()
 
-    # Clean standard PyInstaller directories
-    artifacts = ["build", "dist", "__pycache__"]
+    # Clean standard PyInstaller directories; __pycache__ is left to the
+    # recursive pass below so the tree is only walked once
+    artifacts = ["build", "dist"]
 
     for artifact_name in artifacts:
         artifact_path = project_root / artifact_name
@@ -95,14 +141,22 @@ def clean_build_artifacts():
                 print(f"Removed {artifact_path}")
 
     # Remove .spec files from project root
-    for spec_file in project_root.glob("*.spec"):
-        spec_file.unlink()
+    # A plain suffix test on scandir entries avoids glob's pattern matching
+    with os.scandir(project_root) as entries:
+        spec_files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".spec") and entry.is_file()
+        ]
+    for spec_file in spec_files:
+        os.unlink(spec_file)
         print(f"Removed {spec_file}")
 
-    # Clean __pycache__ directories recursively
-    for pycache in project_root.rglob("__pycache__"):
+    # Clean __pycache__ directories recursively, after build/ and dist/ are
+    # gone; collected first so removal doesn't disturb the walk
+    for pycache in list(project_root.rglob("__pycache__")):
         if pycache.is_dir():
-            shutil.rmtree(pycache)
+            shutil.rmtree(pycache, ignore_errors=True)
             print(f"Removed {pycache}")
 
 
@@ -150,18 +204,79 @@ def check_project_structure():
         "style.py",
         "widgets.py",
     ]
+    existing = get_source_names()
     for file_name in required_files:
-        file_path = sources_dir / file_name
-        if not file_path.exists():
-            print(f"✗ Missing source file: {file_path}")
+        if file_name not in existing:
+            print(f"✗ Missing source file: {sources_dir / file_name}")
             return False
         print(f"✓ Found source file: {file_name}")
 
     return True
 
 
-def build_executable():
-    """Build the executable using PyInstaller."""
+def get_executable_path():
+    """Get the path of the executable PyInstaller writes for --name NumPad."""
+    exe_name = "NumPad.exe" if _SYSTEM == "Windows" else "NumPad"
+    return get_project_root() / "dist" / exe_name
+
+
+def get_build_key_path():
+    """Get the file recording the inputs of the last successful build."""
+    return get_project_root() / "dist" / ".build_key"
+
+
+def compute_build_key():
+    """
+    Hash everything that determines the executable.
+
+    Covers the sources, the assets, this script (which holds the PyInstaller
+    options), the PyInstaller version, the Python interpreter that
+    --onefile bundles, and the platform and architecture.
+
+    Returns:
+        str: Hex SHA256 digest, or None if PyInstaller is not installed
+    """
+    try:
+        import PyInstaller
+    except ImportError:
+        return None
+
+    inputs = sorted(get_sources_dir().glob("*.py"))
+    inputs += sorted(p for p in get_assets_dir().iterdir() if p.is_file())
+    inputs.append(Path(__file__).resolve())
+
+    digest = hashlib.sha256()
+    for path in inputs:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    for part in (
+        PyInstaller.__version__,
+        sys.version,
+        sys.executable,
+        _SYSTEM,
+        platform.machine(),
+    ):
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_build_up_to_date(build_key):
+    """Check if the last successful build used the same inputs."""
+    key_path = get_build_key_path()
+    if build_key is None or not key_path.exists():
+        return False
+    if key_path.read_text(encoding="utf-8").strip() != build_key:
+        return False
+    return get_executable_path().exists()
+
+
+def build_executable(clean=False):
+    """
+    Build the executable using PyInstaller.
+
+    Args:
+        clean: Remove previous build artifacts first, forcing a full rebuild
+    """
     print("NumPad - Build Script")
     print("=" * 40)
 
@@ -172,50 +287,53 @@ def build_executable():
         print("\n✗ Project structure check failed.")
         return False
 
+    # Skip PyInstaller entirely when nothing changed since the last build
+    build_key = compute_build_key()
+    if not clean and is_build_up_to_date(build_key):
+        print("\n✓ Executable is up to date, skipping build.")
+        return True
+
     if not check_dependencies():
         print("\n✗ Dependency check failed.")
         return False
 
     print(f"\nBuilding executable...")
-    print(f"Platform: {platform.system()}")
+    print(f"Platform: {_SYSTEM}")
     print(f"Architecture: {platform.machine()}")
 
-    # Clean previous builds
-    print("\nCleaning previous builds...")
-    clean_build_artifacts()
+    # Clean previous builds only on request; build/ holds PyInstaller's cache
+    if clean:
+        print("\nCleaning previous builds...")
+        clean_build_artifacts()
 
     # Get build command
-    cmd = get_build_command()
+    cmd, options_key = get_build_command()
     print(f"\nRunning PyInstaller...")
     print(f"Command: {' '.join(cmd)}")
 
     try:
-        # Run PyInstaller
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Run PyInstaller on the inherited stdout/stderr, so its log goes
+        # straight to the terminal without passing through this process
+        subprocess.run(cmd, check=True)
+
         print("\n✓ Build completed successfully!")
 
         # Show output location
-        project_root = get_project_root()
-        dist_dir = project_root / "dist"
-        exe_files = list(dist_dir.glob("NumPad*"))
-        if exe_files:
-            exe_file = exe_files[0]
+        exe_file = get_executable_path()
+        if exe_file.exists():
             file_size = exe_file.stat().st_size / (1024 * 1024)  # MB
             print(f"✓ Executable created: {exe_file}")
             print(f"✓ File size: {file_size:.1f} MB")
 
-        # Clean up temporary build directory
-        build_dir = project_root / "build"
-        if build_dir.exists():
-            shutil.rmtree(build_dir)
-            print("✓ Cleaned up temporary files")
+        if build_key is not None:
+            get_build_key_path().write_text(build_key, encoding="utf-8")
+        get_spec_key_path().write_text(options_key, encoding="utf-8")
 
         return True
 
     except subprocess.CalledProcessError as e:
+        # PyInstaller's error output was already printed to the terminal
         print(f"\n✗ Build failed: {e}")
-        if e.stderr:
-            print(f"Error output:\n{e.stderr}")
         return False
 
 
@@ -257,24 +375,44 @@ def create_version_info():
         print(f"✓ Created version info file: {version_file}")
 
 
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the NumPad executable.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="build",
+        choices=["build", "clean", "version"],
+        help="build the executable (default), clean artifacts, "
+        "or create version info",
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="remove previous build artifacts before building",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main function."""
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "clean":
-            print("Cleaning build artifacts...")
-            clean_build_artifacts()
-            print("✓ Clean completed.")
-            return
-        elif sys.argv[1] == "version":
-            print("Creating version info...")
-            create_version_info()
-            return
+    args = parse_args()
+
+    if args.command == "clean":
+        print("Cleaning build artifacts...")
+        clean_build_artifacts()
+        print("✓ Clean completed.")
+        return
+    elif args.command == "version":
+        print("Creating version info...")
+        create_version_info()
+        return
 
     # Create version info for Windows
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         create_version_info()
 
-    success = build_executable()
+    success = build_executable(clean=args.clean)
 
     if success:
         print(f"\n🎉 Build completed successfully!")
@@ -17,18 +17,31 @@ class CharacterManager:
 
     # Combined character set for numpad
     NUMPAD_CHARS = DIGITS + OPERATORS + SPECIAL
+    NUMPAD_SET = frozenset(NUMPAD_CHARS)
+
+    # Pre-drawn characters, refilled in bulk with a single random.choices call
+    POOL_SIZE = 256
+    _pool: List[str] = []
 
     @classmethod
     def get_random_character(cls) -> str:
         """Generate a random character from the numpad character set."""
-        return random.choice(cls.NUMPAD_CHARS)
+        if not cls._pool:
+            cls._pool = random.choices(cls.NUMPAD_CHARS, k=cls.POOL_SIZE)
+        return cls._pool.pop()
 
     @classmethod
     def is_valid_input(cls, char: str) -> bool:
-        """Check if the character is a valid numpad input."""
-        return len(char) == 1 and char in cls.NUMPAD_CHARS
+        """
+        Check if the character is a valid numpad input.
+
+        Kept as public API; the per-key paths test NUMPAD_SET membership
+        directly to skip the method call.
+        """
+        # Only single characters are members, so "" and longer strings fail
+        return char in cls.NUMPAD_SET
 
     @classmethod
     def generate_sequence(cls, length: int) -> List[str]:
-        """Generate a sequence of random characters."""
-        return [cls.get_random_character() for _ in range(length)]
+        """Generate a sequence of random characters in a single draw."""
+        return random.choices(cls.NUMPAD_CHARS, k=length)
@@ -6,12 +6,17 @@ separated from the UI layer for better maintainability.
 """
 
 import time
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, Set, Tuple
 from dataclasses import dataclass
 from characters import CharacterManager
 
+# Valid keystrokes; only single characters are members, so "" and
+# multi-character strings are rejected by the same lookup
+_VALID_INPUT = CharacterManager.NUMPAD_SET
 
-@dataclass
+
+@dataclass(slots=True)
 class TypingStats:
     """Data class to hold typing test statistics."""
 
@@ -47,8 +52,13 @@ class TypingTestEngine:
             window_size: Number of digits to show around current position
         """
         self.window_size = window_size
-        self.target_string: List[str] = []
-        self.typed_chars: List[str] = []
+        self.sequence_length = window_size * 2 + 1
+        # Fixed-size ring buffers: appending past maxlen evicts from the left
+        self.target_string: Deque[str] = deque(maxlen=self.sequence_length)
+        # Per-position status, kept in step with target_string
+        self.statuses: Deque[str] = deque(maxlen=self.sequence_length)
+        self._dirty: Set[int] = set()
+        self._all_positions = frozenset(range(self.sequence_length))
         self.current_pos = 0
         self.stats = TypingStats()
         self.is_active = False
@@ -63,14 +73,19 @@ class TypingTestEngine:
     def reset_stats(self) -> None:
         """Reset all statistics and game state."""
         self.stats = TypingStats()
-        self.typed_chars = []
         self.current_pos = 0
+        self.statuses.clear()
+        self.statuses.extend(["future"] * self.sequence_length)
+        self.statuses[self.current_pos] = "current"
+        self._mark_all_dirty()
 
     def generate_initial_sequence(self) -> None:
         """Generate initial sequence of random characters."""
-        self.target_string = CharacterManager.generate_sequence(
-            self.window_size * 2 + 1
+        self.target_string.clear()
+        self.target_string.extend(
+            CharacterManager.generate_sequence(self.sequence_length)
         )
+        self._mark_all_dirty()
 
     def get_random_character(self) -> str:
         """Generate a single random character."""
@@ -90,69 +105,84 @@ class TypingTestEngine:
             return False
 
         # Only process valid numpad input
-        if not CharacterManager.is_valid_input(user_char):
+        if user_char not in _VALID_INPUT:
             return False
 
-        # Store input and update stats
-        self.typed_chars.append(user_char)
-
-        if user_char == self.target_string[self.current_pos]:
-            self.stats.correct_chars += 1
+        # Update stats (attributes bound to locals once)
+        stats = self.stats
+        statuses = self.statuses
+        dirty = self._dirty
 
-        self.stats.total_chars_typed += 1
-        self.current_pos += 1
+        pos = self.current_pos
+        if user_char == self.target_string[pos]:
+            stats.correct_chars += 1
+            statuses[pos] = "correct"
+        else:
+            statuses[pos] = "incorrect"
+        dirty.add(pos)
 
-        # Update elapsed time
-        self.stats.elapsed_time = time.time() - self.stats.start_time
+        stats.total_chars_typed += 1
+        pos += 1
+        self.current_pos = pos
 
         # Check if we need to slide the window
-        if self.current_pos >= self.window_size + 1:
+        if pos > self.window_size:
             self.slide_window()
+            pos = self.current_pos
+
+        statuses[pos] = "current"
+        dirty.add(pos)
 
         return True
 
     def slide_window(self) -> None:
         """Slide the window and generate new digit."""
-        self.target_string = self.target_string[1:]
-        self.typed_chars = self.typed_chars[1:]
-        self.current_pos -= 1
+        # target_string is full, so append evicts the oldest character
         self.target_string.append(self.get_random_character())
+        self.statuses.append("future")
+        self.current_pos -= 1
+        # Every position now holds a different character
+        self._mark_all_dirty()
 
-    def get_display_data(self) -> Tuple[List[Tuple[str, str]], TypingStats]:
+    def _mark_all_dirty(self) -> None:
+        """Flag every position as changed."""
+        self._dirty.update(self._all_positions)
+
+    def get_dirty_indices(self) -> Set[int]:
+        """
+        Get the positions whose character or status changed since last call.
+
+        Returns:
+            Set of indices into the display data; the tracking set is reset.
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+
+    def get_display_data(
+        self,
+    ) -> Tuple[Deque[str], Deque[str], TypingStats]:
         """
         Get data for UI display.
 
         Returns:
-            Tuple of (character_data, stats) where character_data is a list of
-            (character, status) tuples. Status can be 'correct', 'incorrect',
-            'current', or 'future'.
+            Tuple of (chars, statuses, stats) where chars and statuses are
+            parallel sequences, returned live rather than copied. Status can
+            be 'correct', 'incorrect', 'current', or 'future'.
+        """
+        return self.target_string, self.statuses, self.stats
+
+    def update_elapsed_time(self) -> None:
         """
-        char_data = []
-
-        for i, char in enumerate(self.target_string):
-            if i < self.current_pos:
-                # Already typed characters
-                if i < len(self.typed_chars):
-                    status = (
-                        "correct"
-                        if self.typed_chars[i] == char
-                        else "incorrect"
-                    )
-                else:
-                    status = "future"
-            elif i == self.current_pos:
-                # Current character to type
-                status = "current"
-            else:
-                # Future characters
-                status = "future"
-
-            char_data.append((char, status))
-
-        return char_data, self.stats
+        Refresh elapsed time from the wall clock.
+
+        Kept out of process_input so keystrokes never read the clock; the UI
+        calls this right before it displays time-dependent statistics.
+        """
+        if self.stats.start_time > 0:
+            self.stats.elapsed_time = time.time() - self.stats.start_time
 
     def stop_test(self) -> None:
         """Stop the current test."""
         self.is_active = False
-        if self.stats.start_time > 0:
-            self.stats.elapsed_time = time.time() - self.stats.start_time
+        self.update_elapsed_time()
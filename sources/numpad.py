@@ -10,32 +10,53 @@ from tkinter import ttk
 import platform
 import sys
 import os
-from pathlib import Path
+from typing import Optional
 
-# Add the current directory to Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+# Add the current directory to Python path for imports; a frozen build
+# already bundles the sibling modules, and running the script directly puts
+# its directory on the path already, so both skip this
+if not getattr(sys, "frozen", False):
+    _SOURCES_DIR = os.path.dirname(os.path.abspath(__file__))
+    if _SOURCES_DIR not in sys.path:
+        sys.path.insert(0, _SOURCES_DIR)
 
 from core import TypingTestEngine
 from characters import CharacterManager
-from style import StyleManager
 from widgets import DigitDisplay, StatisticsPanel
 
+# The platform never changes while running, so look it up once
+_SYSTEM = platform.system()
+
+# Fixed UI text and fonts
+_TITLE_FONT = ("Arial", 24, "bold")
+_INSTRUCTIONS_FONT = ("Arial", 10)
+_INSTRUCTIONS_TEXT = "Type the highlighted character • Press R to reset"
+
+# Whether azure.tcl could be loaded; None until the first app probes it
+_AZURE_AVAILABLE: Optional[bool] = None
+
 
 class NumPadApp:
     """Main application class for NumPad."""
 
+    # Interval of the clock tick that refreshes time-based statistics
+    CLOCK_INTERVAL_MS = 500
+
     def __init__(self):
         """Initialize the application."""
         self.root = tk.Tk()
         self.engine = TypingTestEngine()
         self.digit_display = None  # Will be initialized in setup_ui
         self.stats_panel = None  # Will be initialized in setup_ui
+        self._stats_refresh_pending = False
+        # Pending clock tick from root.after(), None while the clock is stopped
+        self._clock_after_id: Optional[str] = None
+        self._clock_last_typed = 0
         self.setup_ui()
         self.setup_bindings()
         self.engine.start_new_test()  # Auto-start
-        self.digit_display.initialize_labels(self.engine.get_display_data()[0])
-        self.update_display()
+        chars, statuses, _ = self.engine.get_display_data()
+        self.digit_display.initialize_digits(chars, statuses)
 
     def setup_ui(self):
         """Set up the user interface."""
@@ -58,12 +79,10 @@ class NumPadApp:
         main_frame.rowconfigure(1, weight=1)  # Make display area expandable
 
         # Title
-        title_label = ttk.Label(
-            main_frame, text="NumPad", font=("Arial", 24, "bold")
-        )
+        title_label = ttk.Label(main_frame, text="NumPad", font=_TITLE_FONT)
         title_label.grid(row=0, column=0, pady=(0, 20))
 
-        # Display frame for numbers with individual digit labels
+        # Display frame for the digit strip
         self.display_frame = ttk.Frame(main_frame)
         self.display_frame.grid(
             row=1, column=0, pady=(0, 20), sticky=(tk.W, tk.E, tk.N, tk.S)
@@ -71,14 +90,9 @@ class NumPadApp:
         self.display_frame.columnconfigure(0, weight=1)
         self.display_frame.rowconfigure(0, weight=1)
 
-        # Container for digit labels with fixed background to prevent flicker
-        self.digits_container = tk.Frame(
-            self.display_frame, bg=StyleManager.COLORS["background"]
-        )
-        self.digits_container.grid(row=0, column=0)
-
-        # Initialize digit display
-        self.digit_display = DigitDisplay(self.digits_container)
+        # Digit strip drawn on a single canvas with a fixed background
+        self.digit_display = DigitDisplay(self.display_frame)
+        self.digit_display.grid(row=0, column=0)
 
         # Stats panel
         self.stats_panel = StatisticsPanel(main_frame)
@@ -93,78 +107,140 @@ class NumPadApp:
         self.reset_button.grid(row=3, column=0, pady=(0, 20))
 
         # Instructions
-        instructions = """Type the highlighted character • Press R to reset"""
         instructions_label = ttk.Label(
-            main_frame, text=instructions, font=("Arial", 10), justify=tk.CENTER
+            main_frame,
+            text=_INSTRUCTIONS_TEXT,
+            font=_INSTRUCTIONS_FONT,
+            justify=tk.CENTER,
         )
         instructions_label.grid(row=4, column=0)
 
     def setup_os_specific_styling(self):
         """Configure OS-specific styling and fonts."""
-        system = platform.system()
+        system = _SYSTEM
 
         if system == "Darwin":  # macOS
             # macOS specific styling
             self.root.configure(bg="#f0f0f0")
         elif system == "Windows":
             # Windows specific styling
-            try:
-                # Use native Windows styling if available
-                self.root.tk.call("source", "azure.tcl")
-                ttk.Style().theme_use("azure")
-            except:
-                pass
+            global _AZURE_AVAILABLE
+            # Each Tk interpreter must source the theme itself, but once it
+            # is known to be missing later apps skip the attempt
+            if _AZURE_AVAILABLE is not False:
+                try:
+                    # Use native Windows styling if available
+                    self.root.tk.call("source", "azure.tcl")
+                    ttk.Style().theme_use("azure")
+                    _AZURE_AVAILABLE = True
+                except tk.TclError:
+                    _AZURE_AVAILABLE = False
         else:  # Linux and others
             # Linux specific styling
             pass
 
     def setup_bindings(self):
         """Set up keyboard bindings."""
+        # One dict lookup per keystroke picks the handler for event.char
+        self._key_handlers = dict.fromkeys(
+            CharacterManager.NUMPAD_CHARS, self.handle_input
+        )
+        self._key_handlers.update(r=self.handle_reset, R=self.handle_reset)
+
+        # Key events on any child reach this binding through its bindtags,
+        # so focus only needs setting once rather than on every click/FocusIn
         self.root.bind("<KeyPress>", self.on_key_press)
-        self.root.bind("<Button-1>", lambda e: self.root.focus_set())
         self.root.focus_set()
 
-        # Make sure the window can receive focus
-        self.root.bind("<FocusIn>", lambda e: self.root.focus_set())
-
     def on_key_press(self, event):
         """Handle key press events."""
-        if CharacterManager.is_valid_input(event.char):
-            self.engine.process_input(event.char)
-            # Only update display immediately for user input
-            self.update_display_immediate()
-        elif event.char.lower() == "r":
-            self.reset_test()
+        handler = self._key_handlers.get(event.char)
+        if handler is not None:
+            handler(event.char)
+
+    def handle_input(self, char: str):
+        """Handle a numpad character."""
+        self.engine.process_input(char)
+        # Digits update now; stats once Tk is idle
+        self.update_digits()
+        self.schedule_stats_refresh()
+
+    def handle_reset(self, char: str):
+        """Handle the reset key."""
+        self.reset_test()
 
     def reset_test(self):
         """Reset the current test."""
-        self.engine.reset_stats()
-        self.engine.generate_initial_sequence()
-        self.engine.start_new_test()  # Auto-restart
-        self.digit_display.initialize_labels(self.engine.get_display_data()[0])
+        self.stop_clock()
+        self._clock_last_typed = 0
+        self.engine.start_new_test()  # Resets stats and regenerates sequence
+        chars, statuses, _ = self.engine.get_display_data()
+        self.digit_display.initialize_digits(chars, statuses)
         self.update_display_immediate()
         self.root.focus_set()
 
-    def update_display_immediate(self):
-        """Update display immediately for user input."""
-        char_data, stats = self.engine.get_display_data()
+    def update_digits(self):
+        """Update only the digit strip after user input."""
+        engine = self.engine
+        chars, statuses, _ = engine.get_display_data()
 
-        # Update digit labels efficiently
-        self.digit_display.update_labels(char_data)
-
-        # Update statistics
-        self.stats_panel.update_stats(stats)
+        # Update the digit strip efficiently, touching only changed positions
+        self.digit_display.update_digits(
+            chars, statuses, engine.get_dirty_indices()
+        )
 
-    def update_display(self):
-        """Update the display with current test data (periodic update)."""
-        if self.engine.is_active:
-            char_data, stats = self.engine.get_display_data()
+    def update_display_immediate(self):
+        """Update statistics immediately (e.g. after a reset)."""
+        # The digits were just laid out by initialize_digits
+        self.engine.update_elapsed_time()
+        self.stats_panel.update_stats(self.engine.stats)
+
+    def schedule_stats_refresh(self):
+        """Refresh statistics once Tk is idle; a burst of keys shares one."""
+        if not self._stats_refresh_pending:
+            self._stats_refresh_pending = True
+            self.root.after_idle(self._refresh_stats)
+
+    def _refresh_stats(self):
+        """Refresh statistics and start the clock if it is not ticking."""
+        self._stats_refresh_pending = False
+        self.engine.update_elapsed_time()
+        self.stats_panel.update_stats(self.engine.stats)
+
+        if self._clock_after_id is None:
+            self._schedule_clock()
+
+    def _schedule_clock(self):
+        """Schedule the next clock tick, remembering its id."""
+        self._clock_after_id = self.root.after(
+            self.CLOCK_INTERVAL_MS, self.update_display
+        )
 
-            # Only update statistics periodically (not digits, to avoid flicker)
-            self.stats_panel.update_stats(stats)
+    def stop_clock(self):
+        """Cancel the pending clock tick, if any."""
+        if self._clock_after_id is not None:
+            self.root.after_cancel(self._clock_after_id)
+            self._clock_after_id = None
 
-            # Schedule next update with longer interval
-            self.root.after(500, self.update_display)
+    def update_display(self):
+        """Tick the time-based statistics while a test is in progress."""
+        engine = self.engine
+        typed = engine.stats.total_chars_typed
+        if not (engine.is_active and typed):
+            self._clock_after_id = None
+            return
+
+        # Accuracy and counts only change on keystrokes
+        engine.update_elapsed_time()
+        self.stats_panel.update_time_stats(engine.stats)
+
+        # No key since the last tick: stop (no idle wakeups) until the next
+        # keystroke restarts the clock through _refresh_stats
+        if typed == self._clock_last_typed:
+            self._clock_after_id = None
+            return
+        self._clock_last_typed = typed
+        self._schedule_clock()
 
     def run(self):
         """Start the application main loop."""
@@ -183,7 +259,7 @@ def main():
         # Handle any startup errors gracefully
         if "tkinter" in str(e).lower():
             print("Error: Tkinter is not available. Please install tkinter.")
-            if platform.system() == "Linux":
+            if _SYSTEM == "Linux":
                 print("On Ubuntu/Debian: sudo apt-get install python3-tk")
                 print("On CentOS/RHEL: sudo yum install tkinter")
         else:
@@ -4,7 +4,8 @@ Defines colors, fonts, and other visual styling properties.
 """
 
 from dataclasses import dataclass
-from typing import Tuple
+from functools import cached_property
+from typing import Any, Dict, Tuple
 
 
 @dataclass
@@ -18,6 +19,11 @@ class CharacterStyle:
     border_color: str = "#000000"
     border_width: int = 1
 
+    @cached_property
+    def font_tuple(self) -> Tuple[str, int, str]:
+        """Font tuple for tkinter, built on first use and kept."""
+        return (StyleManager.FONT_FAMILY, self.font_size, self.font_weight)
+
 
 class StyleManager:
     """Manages all styling for the NumPad application."""
@@ -27,6 +33,10 @@ class StyleManager:
     NORMAL_FONT_SIZE = 48
     CURRENT_FONT_SIZE = 56
 
+    # Known statuses and their small integer codes (index in STATUSES)
+    STATUSES = ("future", "correct", "incorrect", "current")
+    STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
     # Color definitions
     COLORS = {
         "current": "#FFD700",  # Gold
@@ -65,6 +75,14 @@ class StyleManager:
         ),
     }
 
+    # Font tuples per status, built once from STYLES below the class so
+    # redraws reuse the same objects
+    FONTS: Dict[str, Tuple[str, int, str]]
+
+    # Ready-made widget options per status, handed out by reference; built
+    # from STYLES below the class
+    STYLE_KWARGS: Dict[str, Dict[str, Any]]
+
     @classmethod
     def get_style(cls, status: str) -> CharacterStyle:
         """Get style configuration for a given status."""
@@ -73,4 +91,23 @@ class StyleManager:
     @classmethod
     def get_font_tuple(cls, style: CharacterStyle) -> Tuple[str, int, str]:
         """Get font tuple for tkinter."""
-        return (cls.FONT_FAMILY, style.font_size, style.font_weight)
+        return style.font_tuple
+
+    @classmethod
+    def get_kwargs(cls, status: str) -> Dict[str, Any]:
+        """Get the bg/fg/font options for a given status (do not mutate)."""
+        return cls.STYLE_KWARGS.get(status, cls.STYLE_KWARGS["future"])
+
+
+StyleManager.FONTS = {
+    status: style.font_tuple for status, style in StyleManager.STYLES.items()
+}
+
+StyleManager.STYLE_KWARGS = {
+    status: {
+        "bg": style.bg_color,
+        "fg": style.fg_color,
+        "font": StyleManager.FONTS[status],
+    }
+    for status, style in StyleManager.STYLES.items()
+}
@@ -4,134 +4,416 @@ Contains reusable UI components and widget management.
 """
 
 import tkinter as tk
-from tkinter import ttk
-from typing import List, Tuple, Optional
-from style import StyleManager, CharacterStyle
+import tkinter.font as tkfont
+from contextlib import contextmanager
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Optional,
+)
+from style import StyleManager
+
+# Font of the statistics values
+_STATS_FONT = ("Arial", 12, "bold")
+
+# Statistics text templates, bound once; %-formatting a float goes straight
+# to the C formatter
+_ACCURACY_FORMAT = "%.2f%%".__mod__
+_NPM_FORMAT = "%.2f".__mod__
+_CHARS_FORMAT = "%d / %d".__mod__
+_TIME_FORMAT = "%.2fs".__mod__
+
+# Shared empty option dict for slot parts that did not change; never modified
+_NO_OPTIONS: Dict[str, Any] = {}
+
+# Nesting depth of batch_updates() and the updates deferred by it, keyed by
+# (widget id, kind) so repeated updates of one widget collapse to the last
+_batch_depth = 0
+_batched: Dict[Tuple[int, str], Callable[[], None]] = {}
+
+
+@contextmanager
+def batch_updates() -> Iterator[None]:
+    """
+    Defer display updates until the outermost batch_updates() block exits.
+
+    Updates of the same widget made inside the block collapse into one,
+    applied on exit in the order the widgets were first updated. If the
+    outermost block raises, every deferred update is discarded; an inner
+    block that raises leaves its updates queued for the outer block.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    except BaseException:
+        _batch_depth -= 1
+        if not _batch_depth:
+            _batched.clear()
+        raise
+
+    _batch_depth -= 1
+    if not _batch_depth:
+        queued = list(_batched.values())
+        _batched.clear()
+        for update in queued:
+            update()
 
 
 class DigitDisplay:
-    """Manages the display of digit labels with efficient updating."""
-
-    def __init__(self, parent_container: tk.Widget):
-        """Initialize the digit display."""
-        self.container = parent_container
-        self.labels: List[tk.Label] = []
-        self.last_char_data: List[Tuple[str, str]] = []
-
-    def initialize_labels(self, char_data: List[Tuple[str, str]]):
-        """Initialize digit labels with proper styling."""
-        self.clear_labels()
-
-        for i, (char, status) in enumerate(char_data):
-            style = StyleManager.get_style(status)
-            font = StyleManager.get_font_tuple(style)
-
-            label = tk.Label(
-                self.container,
-                text=char,
-                font=font,
-                bg=style.bg_color,
-                fg=style.fg_color,
-                width=2,
-                relief="solid",
-                borderwidth=style.border_width,
+    """Draws the digit strip as items on a single canvas."""
+
+    # Horizontal gap between slots and margin above/below the strip, in pixels
+    SLOT_GAP = 4
+    STRIP_MARGIN = 10
+    # Text of pooled slots not yet showing a character
+    BLANK = " "
+
+    def __init__(self, parent: tk.Widget, pool_size: int = 32):
+        """
+        Initialize the digit display.
+
+        Args:
+            parent: Widget to place the canvas in
+            pool_size: Slots to create up front; the pool doubles if needed
+        """
+        self.canvas = tk.Canvas(
+            parent,
+            bg=StyleManager.COLORS["background"],
+            highlightthickness=0,
+        )
+        # (box, text) canvas item ids per pooled slot; slots are hidden
+        # rather than deleted, and only the first `visible` are shown
+        self.slots: List[Tuple[int, int]] = []
+        # canvas.itemconfigure pre-bound to each slot's box and text item
+        self.box_configs: List[Callable[..., Any]] = []
+        self.text_configs: List[Callable[..., Any]] = []
+        # What each slot shows, as parallel byte buffers: the character code
+        # (characters are single-byte) and the StyleManager status code
+        self.shown_chars = bytearray()
+        self.shown_statuses = bytearray()
+        self.visible = 0
+        self.pool_size = pool_size
+        self.fonts = self._create_fonts()
+        self.slot_width, self.slot_height = self._measure_slot()
+        # The height never changes; only the width follows the visible count
+        self.canvas.configure(height=self.slot_height + 2 * self.STRIP_MARGIN)
+        self.transition_options = self._create_transition_options()
+        self.blank_options = self._create_blank_options()
+        self._grow_pool(0)
+
+    def _create_fonts(self) -> Dict[str, tkfont.Font]:
+        """Create one named Tk font per distinct font spec, keyed by status."""
+        fonts_by_spec: Dict[Tuple[str, int, str], tkfont.Font] = {}
+        fonts = {}
+
+        for status, spec in StyleManager.FONTS.items():
+            if spec not in fonts_by_spec:
+                fonts_by_spec[spec] = tkfont.Font(root=self.canvas, font=spec)
+            fonts[status] = fonts_by_spec[spec]
+
+        return fonts
+
+    def _create_transition_options(
+        self,
+    ) -> List[List[Tuple[Dict[str, Any], Dict[str, Any]]]]:
+        """
+        Resolve the item options of every status change up front.
+
+        Returns:
+            Table indexed [old][new] by status code, holding the read-only
+            (box_options, text_options) that change from old to new
+        """
+        get_kwargs = StyleManager.get_kwargs
+        table = []
+        for old_status in StyleManager.STATUSES:
+            old_kwargs = get_kwargs(old_status)
+            row = []
+            for status in StyleManager.STATUSES:
+                kwargs = get_kwargs(status)
+                box_options = {}
+                text_options = {}
+                if old_kwargs["bg"] != kwargs["bg"]:
+                    box_options["fill"] = kwargs["bg"]
+                if old_kwargs["fg"] != kwargs["fg"]:
+                    text_options["fill"] = kwargs["fg"]
+                if old_kwargs["font"] != kwargs["font"]:
+                    text_options["font"] = self._get_font(status)
+                row.append((box_options, text_options))
+            table.append(row)
+        return table
+
+    def _create_blank_options(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the (box, text) item options of a new, hidden blank slot."""
+        style = StyleManager.get_style("future")
+        kwargs = StyleManager.get_kwargs("future")
+
+        box_options = {
+            "fill": kwargs["bg"],
+            "outline": style.border_color,
+            "width": style.border_width,
+            "state": tk.HIDDEN,
+        }
+        text_options = {
+            "text": self.BLANK,
+            "font": self._get_font("future"),
+            "fill": kwargs["fg"],
+            "state": tk.HIDDEN,
+        }
+        return box_options, text_options
+
+    def _get_font(self, status: str) -> tkfont.Font:
+        """Get the named font for a given status."""
+        return self.fonts.get(status, self.fonts["future"])
+
+    def _measure_slot(self) -> Tuple[int, int]:
+        """Size every slot to fit two digits of the largest font."""
+        fonts = self.fonts.values()
+        border = max(
+            style.border_width for style in StyleManager.STYLES.values()
+        )
+        inset = 2 * (border + 1)
+
+        width = max(font.measure("0") for font in fonts) * 2 + inset
+        height = max(font.metrics("linespace") for font in fonts) + inset
+        return width, height
+
+    def grid(self, **kwargs):
+        """Grid the digit canvas."""
+        self.canvas.grid(**kwargs)
+
+    def initialize_digits(self, chars: Sequence[str], statuses: Sequence[str]):
+        """Initialize the digit slots with proper styling."""
+        count = len(chars)
+        if count > len(self.slots):
+            self._grow_pool(count)
+
+        # Every shown slot (e.g. on a reset) goes through the normal diff, so
+        # only the options that differ from what it holds are reconfigured
+        self._apply_updates(self._calculate_updates(chars, statuses))
+        self._set_visible(count)
+
+    def _grow_pool(self, count: int):
+        """Create hidden blank slots, at least doubling the pool size."""
+        size = max(count, 2 * len(self.slots), self.pool_size)
+        width, height = self.slot_width, self.slot_height
+        step = width + self.SLOT_GAP
+        top = self.STRIP_MARGIN
+        offset = self.SLOT_GAP // 2
+
+        # Every new slot starts blank in the "future" style
+        box_options, text_options = self.blank_options
+
+        # Bound to locals once rather than looked up per slot
+        create_rectangle = self.canvas.create_rectangle
+        create_text = self.canvas.create_text
+        itemconfigure = self.canvas.itemconfigure
+        add_slot = self.slots.append
+        add_box_config = self.box_configs.append
+        add_text_config = self.text_configs.append
+
+        for i in range(len(self.slots), size):
+            left = offset + i * step
+
+            box = create_rectangle(
+                left, top, left + width, top + height, **box_options
+            )
+            text = create_text(
+                left + width // 2, top + height // 2, **text_options
             )
-            label.grid(row=0, column=i, padx=2, pady=10)
-            self.labels.append(label)
+            add_slot((box, text))
+            add_box_config(partial(itemconfigure, box))
+            add_text_config(partial(itemconfigure, text))
+
+        added = size - len(self.shown_chars)
+        self.shown_chars.extend(self.BLANK.encode("ascii") * added)
+        self.shown_statuses.extend(
+            bytes([StyleManager.STATUS_CODES["future"]]) * added
+        )
 
-        self.last_char_data = list(char_data)
+    def _set_visible(self, count: int):
+        """Show the first count slots, hiding the rest of the pool."""
+        visible = self.visible
+        if count == visible:
+            return
+
+        # Only the slots between the old and new count change state
+        state = tk.NORMAL if count > visible else tk.HIDDEN
+        for i in range(min(count, visible), max(count, visible)):
+            self.box_configs[i](state=state)
+            self.text_configs[i](state=state)
+
+        self.visible = count
+        self._resize_canvas()
+
+    def _resize_canvas(self):
+        """Size the canvas width to fit the visible slots."""
+        self.canvas.configure(
+            width=self.visible * (self.slot_width + self.SLOT_GAP)
+        )
+
+    def update_digits(
+        self,
+        chars: Sequence[str],
+        statuses: Sequence[str],
+        indices: Optional[Iterable[int]] = None,
+    ):
+        """
+        Update digit slots efficiently - only change what's necessary.
+
+        Args:
+            chars: Character per position
+            statuses: Status per position, parallel to chars
+            indices: Positions known to have changed; None checks them all
+        """
+        if _batch_depth:
+            # Collapsed updates may have changed different positions, so the
+            # deferred one checks them all
+            _batched[(id(self), "digits")] = partial(
+                self.update_digits, chars, statuses
+            )
+            return
 
-    def update_labels(self, char_data: List[Tuple[str, str]]):
-        """Update labels efficiently - only change what's necessary."""
-        # Adjust number of labels if needed
-        self._adjust_label_count(char_data)
+        # The slot count is fixed by initialize_digits; only a change in
+        # sequence length needs the slower path
+        if len(chars) != self.visible:
+            self.initialize_digits(chars, statuses)
+            return
 
-        # Batch all label updates
-        updates_needed = self._calculate_updates(char_data)
+        # Batch all item updates
+        updates_needed = self._calculate_updates(chars, statuses, indices)
 
         # Apply all updates at once
         self._apply_updates(updates_needed)
 
-        # Hide extra labels if sequence got shorter
-        self._hide_extra_labels(len(char_data))
-
-        # Cache current data
-        self.last_char_data = list(char_data)
-
-    def _adjust_label_count(self, char_data: List[Tuple[str, str]]):
-        """Ensure we have enough labels for the character data."""
-        while len(self.labels) < len(char_data):
-            # Add new label with default styling
-            style = StyleManager.get_style("future")
-            font = StyleManager.get_font_tuple(style)
-
-            label = tk.Label(
-                self.container,
-                text="",
-                font=font,
-                bg=style.bg_color,
-                fg=style.fg_color,
-                width=2,
-                relief="solid",
-                borderwidth=style.border_width,
-            )
-            label.grid(row=0, column=len(self.labels), padx=2, pady=10)
-            self.labels.append(label)
+        # No update_idletasks() here: redraws are left to Tk's idle handler
+        # so that several quick keystrokes can share a single repaint.
 
     def _calculate_updates(
-        self, char_data: List[Tuple[str, str]]
-    ) -> List[Tuple[int, str, CharacterStyle]]:
-        """Calculate which labels need updating."""
+        self,
+        chars: Sequence[str],
+        statuses: Sequence[str],
+        indices: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, Dict[str, Any], Dict[str, Any]]]:
+        """Calculate which slots need updating and which options changed."""
         updates_needed = []
-
-        for i, (char, status) in enumerate(char_data):
-            if i >= len(self.labels):
-                break
-
-            # Check if this label needs updating
-            need_update = i >= len(self.last_char_data) or self.last_char_data[
-                i
-            ] != (char, status)
-
-            if need_update:
-                style = StyleManager.get_style(status)
-                updates_needed.append((i, char, style))
+        add_update = updates_needed.append
+        shown_chars = self.shown_chars
+        shown_statuses = self.shown_statuses
+        status_codes = StyleManager.STATUS_CODES
+        transition_options = self.transition_options
+
+        # A full check encodes the sequence into two byte strings and zips
+        # them against the shown buffers; a known set of changed positions
+        # is encoded one by one
+        if indices is None:
+            new_chars = "".join(chars).encode("ascii")
+            new_statuses = bytes([status_codes.get(s, 0) for s in statuses])
+            # A refresh with nothing new is settled by two buffer compares,
+            # without slicing or visiting each position
+            unchanged = shown_chars.startswith(new_chars)
+            if unchanged and shown_statuses.startswith(new_statuses):
+                return updates_needed
+            positions = enumerate(
+                zip(new_chars, new_statuses, shown_chars, shown_statuses)
+            )
+        else:
+            positions = [
+                (
+                    i,
+                    (
+                        ord(chars[i]),
+                        status_codes.get(statuses[i], 0),
+                        shown_chars[i],
+                        shown_statuses[i],
+                    ),
+                )
+                for i in indices
+            ]
+
+        for i, (char, status, old_char, old_status) in positions:
+            # Small int compares; decode only when the slot changed
+            if char == old_char and status == old_status:
+                continue
+            shown_chars[i] = char
+            shown_statuses[i] = status
+
+            if status != old_status:
+                # Precomputed and shared; the dicts are only read
+                options_from = transition_options[old_status]
+                box_options, text_options = options_from[status]
+                if char != old_char:
+                    text_options = {**text_options, "text": chr(char)}
+            else:
+                # Only the character changed: update just the text item's text
+                add_update((i, _NO_OPTIONS, {"text": chr(char)}))
+                continue
+
+            if box_options or text_options:
+                add_update((i, box_options, text_options))
 
         return updates_needed
 
     def _apply_updates(
-        self, updates_needed: List[Tuple[int, str, CharacterStyle]]
+        self, updates_needed: List[Tuple[int, Dict[str, Any], Dict[str, Any]]]
     ):
-        """Apply all label updates at once."""
-        for i, char, style in updates_needed:
-            font = StyleManager.get_font_tuple(style)
-            self.labels[i].config(
-                text=char, font=font, bg=style.bg_color, fg=style.fg_color
-            )
+        """Apply all item updates at once."""
+        box_configs = self.box_configs
+        text_configs = self.text_configs
 
-    def _hide_extra_labels(self, active_count: int):
-        """Hide labels that are no longer needed."""
-        for i in range(active_count, len(self.labels)):
-            self.labels[i].grid_remove()
+        for i, box_options, text_options in updates_needed:
+            if box_options:
+                box_configs[i](**box_options)
+            if text_options:
+                text_configs[i](**text_options)
 
-    def clear_labels(self):
-        """Clear all existing labels."""
-        for label in self.labels:
-            label.destroy()
-        self.labels.clear()
-        self.last_char_data.clear()
+    def clear_slots(self):
+        """Hide every slot; the items stay pooled for reuse."""
+        self._set_visible(0)
 
 
 class StatisticsPanel:
     """Manages the statistics display panel."""
 
+    # Fixed width (in characters) of the value labels, so that new values
+    # never change their requested size and trigger a geometry pass
+    VALUE_WIDTH = 12
+    # Minimum time between two full statistics redraws (at most 20 per second)
+    MIN_INTERVAL_MS = 50
+
     def __init__(self, parent: tk.Widget):
         """Initialize the statistics panel."""
-        self.frame = ttk.LabelFrame(parent, text="Statistics", padding="10")
+        # Classic Tk widgets: the panel is static apart from its values, so
+        # it skips the ttk theme engine on every redraw
+        self.frame = tk.Frame(parent, bd=1, relief=tk.SOLID, padx=10, pady=10)
         self.accuracy_var = tk.StringVar(value="0.00%")
         self.npm_var = tk.StringVar(value="0.00")
         self.chars_var = tk.StringVar(value="0 / 0")
         self.time_var = tk.StringVar(value="0.00s")
+        # Last text written to each variable, to skip redundant writes
+        self._last_values: Dict[str, str] = {
+            "accuracy": "0.00%",
+            "npm": "0.00",
+            "chars": "0 / 0",
+            "time": "0.00s",
+        }
+        # Bound StringVar.set methods, looked up once
+        self._setters = {
+            "accuracy": self.accuracy_var.set,
+            "npm": self.npm_var.set,
+            "chars": self.chars_var.set,
+            "time": self.time_var.set,
+        }
+        # Throttle window timer and the latest stats that arrived within it
+        self._throttle_id: Optional[str] = None
+        self._pending_stats = None
 
         self._setup_labels()
 
@@ -139,46 +421,83 @@ class StatisticsPanel:
         """Set up the statistics labels."""
         self.frame.columnconfigure(1, weight=1)
 
-        # Accuracy
-        ttk.Label(self.frame, text="Accuracy:").grid(
-            row=0, column=0, sticky=tk.W, padx=(0, 10)
-        )
-        ttk.Label(
-            self.frame,
-            textvariable=self.accuracy_var,
-            font=("Arial", 12, "bold"),
-        ).grid(row=0, column=1, sticky=tk.W)
-
-        # NPM
-        ttk.Label(self.frame, text="NPM:").grid(
-            row=1, column=0, sticky=tk.W, padx=(0, 10)
+        tk.Label(self.frame, text="Statistics").grid(
+            row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5)
         )
-        ttk.Label(
-            self.frame, textvariable=self.npm_var, font=("Arial", 12, "bold")
-        ).grid(row=1, column=1, sticky=tk.W)
 
-        # Characters
-        ttk.Label(self.frame, text="Characters:").grid(
-            row=2, column=0, sticky=tk.W, padx=(0, 10)
+        rows = [
+            ("Accuracy:", self.accuracy_var),
+            ("NPM:", self.npm_var),
+            ("Characters:", self.chars_var),
+            ("Time:", self.time_var),
+        ]
+        for row, (text, variable) in enumerate(rows, start=1):
+            tk.Label(self.frame, text=text).grid(
+                row=row, column=0, sticky=tk.W, padx=(0, 10)
+            )
+            tk.Label(
+                self.frame,
+                textvariable=variable,
+                font=_STATS_FONT,
+                width=self.VALUE_WIDTH,
+                anchor=tk.W,
+            ).grid(row=row, column=1, sticky=tk.W)
+
+    def update_stats(self, stats):
+        """
+        Update all statistics displays, at most once per MIN_INTERVAL_MS.
+
+        An update arriving within that interval of the previous redraw is
+        held back, and only the latest one is shown when the interval ends.
+        """
+        if _batch_depth:
+            _batched[(id(self), "stats")] = partial(self.update_stats, stats)
+            return
+
+        if self._throttle_id is not None:
+            self._pending_stats = stats
+            return
+
+        self._write_stats(stats)
+        self._throttle_id = self.frame.after(
+            self.MIN_INTERVAL_MS, self._end_throttle
         )
-        ttk.Label(
-            self.frame, textvariable=self.chars_var, font=("Arial", 12, "bold")
-        ).grid(row=2, column=1, sticky=tk.W)
 
-        # Time
-        ttk.Label(self.frame, text="Time:").grid(
-            row=3, column=0, sticky=tk.W, padx=(0, 10)
+    def _end_throttle(self):
+        """Show the update held back during the interval, if any."""
+        self._throttle_id = None
+        stats, self._pending_stats = self._pending_stats, None
+        if stats is not None:
+            self.update_stats(stats)
+
+    def _write_stats(self, stats):
+        """Write all statistics to their variables."""
+        set_value = self._set
+        set_value("accuracy", _ACCURACY_FORMAT(stats.accuracy_percentage))
+        set_value("npm", _NPM_FORMAT(stats.npm))
+        set_value(
+            "chars",
+            _CHARS_FORMAT((stats.correct_chars, stats.total_chars_typed)),
         )
-        ttk.Label(
-            self.frame, textvariable=self.time_var, font=("Arial", 12, "bold")
-        ).grid(row=3, column=1, sticky=tk.W)
+        set_value("time", _TIME_FORMAT(stats.elapsed_time))
 
-    def update_stats(self, stats):
-        """Update all statistics displays."""
-        self.accuracy_var.set(f"{stats.accuracy_percentage:.2f}%")
-        self.npm_var.set(f"{stats.npm:.2f}")
-        self.chars_var.set(f"{stats.correct_chars} / {stats.total_chars_typed}")
-        self.time_var.set(f"{stats.elapsed_time:.2f}s")
+    def update_time_stats(self, stats):
+        """Update only the displays that change with time (NPM and time)."""
+        if _batch_depth:
+            _batched[(id(self), "time")] = partial(
+                self.update_time_stats, stats
+            )
+            return
+
+        self._set("npm", _NPM_FORMAT(stats.npm))
+        self._set("time", _TIME_FORMAT(stats.elapsed_time))
+
+    def _set(self, key: str, text: str):
+        """Set a variable only if its text changed, sparing a label redraw."""
+        last_values = self._last_values
+        if last_values[key] != text:
+            last_values[key] = text
+            self._setters[key](text)
 
     def grid(self, **kwargs):
         """Grid the statistics frame."""